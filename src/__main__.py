@@ -1,8 +1,16 @@
 import asyncio
+import contextlib
 import logging
 
 from apify.log import ActorLogFormatter
 
+# uvloop is a drop-in libuv-based event loop that speeds up the async Actor
+# lifecycle; fall back to the default loop where it is unavailable.
+with contextlib.suppress(ImportError):
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 from .main import main
 
 handler = logging.StreamHandler()
@@ -16,5 +24,17 @@ apify_logger = logging.getLogger('apify')
 apify_logger.setLevel(logging.INFO)
 apify_logger.addHandler(handler)
 
-# Execute the Actor entry point.
-asyncio.run(main())
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the event loop from the installed policy, with eager task startup when available."""
+    loop = asyncio.get_event_loop_policy().new_event_loop()
+    # Python 3.12+: start tasks eagerly so coroutines that finish without
+    # blocking never pay the scheduler round-trip.
+    if eager_task_factory := getattr(asyncio, 'eager_task_factory', None):
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+# Execute the Actor entry point on a single explicitly-managed event loop.
+with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+    runner.run(main())
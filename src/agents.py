@@ -1,195 +1,234 @@
-from crewai import Agent  # type: ignore[import-untyped]
-
-from src.tools import (
-    GetActorCodeTool,
-    GetActorInputSchemaTool,
-    GetActorPricingInfoTool,
-    GetActorReadmeTool,
-    SearchRelatedActorsTool,
-)
+from __future__ import annotations
 
-from src.const import PEDANTIC_MESSAGE_BACKSTORY, PEDANTIC_MESSAGE, SUGGESTIONS_MESSAGE
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
+if TYPE_CHECKING:
+    from crewai import LLM, Agent  # type: ignore[import-untyped]
 
-def create_actor_inspector_agent(llm: str, debug: bool = False, pedantic: bool = False) -> Agent:
-    """
-    Agent for project management.
+from src.const import PEDANTIC_MESSAGE, PEDANTIC_MESSAGE_BACKSTORY, SUGGESTIONS_MESSAGE
 
-    Args:
-        llm (str): LLM model name.
-        debug (bool): If True, the agent will operate in verbose mode for debugging purposes.
-        pedantic (bool): If True, the agent will be more pedantic.
 
-    Returns:
-        Agent: An instance of the Agent class configured for project management.
-    """
-    return Agent(
-        role='Lead actor inspector',
-        goal=(
-            'Coordinate a comprehensive quality review of an Apify Actor by synthesizing detailed reports from '
-            'specialized agents and delivering a final assessment with clear ratings and justifications.'
-            f'{PEDANTIC_MESSAGE if pedantic else ""}'
-            f'{SUGGESTIONS_MESSAGE}'
-        ),
-        backstory=(
-            "I'm a veteran project manager with a deep understanding of Apify Actors, skilled at orchestrating teams "
-            'of expert agents. My strength lies in distilling complex analyses into concise, actionable reports that '
-            'drive improvement and ensure quality.'
-            f'{PEDANTIC_MESSAGE_BACKSTORY if pedantic else ""}'
-        ),
-        allow_delegation=True,
-        verbose=debug,
-        llm=llm,
-    )
+@lru_cache(maxsize=1)
+def _agent_class() -> type[Agent]:
+    """Resolve crewai.Agent on first use so importing this module does not pull in the whole crewai stack."""
+    from crewai import Agent
 
+    return cast('type[Agent]', Agent)
 
-def create_code_quality_agent(llm: str, debug: bool = False, pedantic: bool = False) -> Agent:
-    """
-    Create an Agent instance configured for code quality inspection.
 
-    Args:
-        llm (str): LLM model name.
-        debug (bool): If True, the agent will operate in verbose mode for debugging purposes.
-        pedantic (bool): If True, the agent will be more pedantic.
-    Returns:
-        Agent: An instance of the Agent class configured for code quality inspection.
+@lru_cache(maxsize=1)
+def _shared_tools() -> dict[str, Any]:
+    """Build the shared tool instances on first use.
+
+    Tool instances are stateless, so a single shared instance per tool is
+    enough for all agents instead of allocating a new one on every factory
+    call; importing them lazily keeps the crewai tool stack off the module
+    import path.
     """
-    tools = [GetActorCodeTool()]
-    return Agent(
-        role='Code quality specialist',
-        goal=(
-            'Deliver a precise evaluation of the code quality for a GitHub repository, focusing on tests, '
-            'linting, code smells, security vulnerabilities, performance issues, and code style consistency.'
-            f'{PEDANTIC_MESSAGE if pedantic else ""}'
-            f'{SUGGESTIONS_MESSAGE}'
-        ),
-        backstory=(
-            "I'm a seasoned software engineer with over a decade of experience auditing codebases for startups "
-            'and enterprises alike. Armed with tools like GitHub repository analysis, I excel at identifying '
-            'strengths and weaknesses in code quality, offering actionable insights to improve reliability, '
-            'maintainability, and performance.'
-            f'{PEDANTIC_MESSAGE_BACKSTORY if pedantic else ""}'
-        ),
-        tools=tools,
-        verbose=debug,
-        llm=llm,
+    from src.tools import (
+        GetActorCodeTool,
+        GetActorInputSchemaTool,
+        GetActorPricingInfoTool,
+        GetActorReadmeTool,
+        SearchRelatedActorsTool,
     )
 
+    return {
+        'actor_code': GetActorCodeTool(),
+        'actor_input_schema': GetActorInputSchemaTool(),
+        'actor_pricing_info': GetActorPricingInfoTool(),
+        'actor_readme': GetActorReadmeTool(),
+        'search_related_actors': SearchRelatedActorsTool(),
+    }
 
-def create_actor_definition_quality_agent(llm: str, debug: bool = False, pedantic: bool = False) -> Agent:
-    """
-    Create an Agent instance configured for Apify Actor quality inspection.
 
-    Args:
-        llm (str): LLM model name.
-        debug (bool): If True, the agent will operate in verbose mode for debugging purposes.
-        pedantic (bool): If True, the agent will be more pedantic.
+def _goal_variants(base: str, suffix: str = '') -> dict[bool, str]:
+    """Precompute both pedantic variants of an agent goal, interned so all agents share one string object."""
+    return {
+        True: sys.intern(base + PEDANTIC_MESSAGE + SUGGESTIONS_MESSAGE + suffix),
+        False: sys.intern(base + SUGGESTIONS_MESSAGE + suffix),
+    }
 
-    Returns:
-        Agent: An instance of the Agent class configured for Apify Actor quality inspection.
-    """
-    tools = [GetActorInputSchemaTool(), GetActorReadmeTool()]
-    return Agent(
+
+def _backstory_variants(base: str) -> dict[bool, str]:
+    """Precompute both pedantic variants of an agent backstory, interned like the goals."""
+    return {
+        True: sys.intern(base + PEDANTIC_MESSAGE_BACKSTORY),
+        False: sys.intern(base),
+    }
+
+
+_INSPECTOR_GOALS = _goal_variants(
+    'Coordinate a quality review of an Apify Actor and deliver a final assessment '
+    'with clear ratings and justifications.'
+)
+_INSPECTOR_BACKSTORIES = _backstory_variants(
+    "I'm a veteran project manager skilled at distilling expert analyses of Apify Actors "
+    'into concise, actionable reports.'
+)
+
+_CODE_QUALITY_GOALS = _goal_variants(
+    'Evaluate the code quality of a GitHub repository: tests, linting, code smells, '
+    'security vulnerabilities, performance issues, and code style consistency.'
+)
+_CODE_QUALITY_BACKSTORIES = _backstory_variants(
+    "I'm a seasoned software engineer experienced in auditing codebases, identifying "
+    'strengths and weaknesses in code quality and offering actionable insights.'
+)
+
+_ACTOR_DEFINITION_GOALS = _goal_variants(
+    "Assess the quality of an Apify Actor's documentation and usability by analyzing its README clarity, "
+    'input properties, ease of use, example provision, and GitHub link visibility.'
+)
+_ACTOR_DEFINITION_BACKSTORIES = _backstory_variants(
+    "I'm a meticulous Apify expert who reviews Actors for usability and documentation "
+    'quality against Apify Store standards, using tools to fetch READMEs and input schemas.'
+)
+
+_UNIQUENESS_GOALS = dict.fromkeys(
+    (True, False),
+    sys.intern(
+        'Compare an Actors functionality and uniqueness by reading its README and '
+        'searching related Actors using keywords.\n'
+        'Provide a very short report with one of these grades:\n'
+        'GREAT (unique), GOOD (some similarity), BAD (similar to others).\n'
+        'Always explain (briefly!) functional differences.\n'
+    ),
+)
+_UNIQUENESS_BACKSTORIES = _backstory_variants(
+    'I am an Apify expert familiar with the platform and its Actors.\n'
+    'My tools include retrieving Actor README and performing full-text searches to '
+    'find related Actors. I pass 3-5 different keyword sets to a single search call, '
+    'which searches them all at once. I need to gather at least a couple of related '
+    'Actors to provide a good comparison.'
+)
+
+_PRICING_GOALS = _goal_variants(
+    "Compare an Actor's pricing by retrieving its pricing information and "
+    'searching for related Actors using keywords.\n'
+    'Apify pricing models:\n'
+    '- 5$ Free Plan: Use selected Actors free of charge, paying only platform usage costs.\n'
+    '- Rental Model: After a trial, pay a flat monthly fee; developers receive 80% of the fees.\n'
+    '- Pay-per-Result: Pay only for the results produced, with no extra usage fees.\n'
+    '- Pay-per-Event: Pay for each specific action or event.\n'
+    '- Pay-per-Usage: Pay based on the Apify platform usage generated when running the Actor.\n'
+    'Provide a very short report with one of these ratings:\n'
+    'GREAT (competitive pricing), GOOD (moderate), BAD (expensive).\n',
+    suffix='Include a brief explanation.\n',
+)
+_PRICING_BACKSTORIES = _backstory_variants(
+    'I am an Apify expert specialized in pricing analysis. My tools retrieve pricing details and search '
+    'related Actors; I pass 3-5 different keyword sets to a single search call, which searches them all '
+    'at once. I compare different pricing models and evaluate overall competitiveness.\n'
+)
+
+
+class _AgentSpec(NamedTuple):
+    """Immutable static configuration for one agent kind."""
+
+    role: str
+    goals: dict[bool, str]
+    backstories: dict[bool, str]
+    tools: tuple[str, ...] = ()
+    allow_delegation: bool = False
+
+
+# Single construction path for all agents: each entry holds the static
+# configuration for one agent kind, with goals/backstories as the precomputed
+# pedantic variant dicts above.
+_AGENT_SPECS: dict[str, _AgentSpec] = {
+    'actor_inspector': _AgentSpec(
+        role='Lead actor inspector',
+        goals=_INSPECTOR_GOALS,
+        backstories=_INSPECTOR_BACKSTORIES,
+        allow_delegation=True,
+    ),
+    'code_quality': _AgentSpec(
+        role='Code quality specialist',
+        goals=_CODE_QUALITY_GOALS,
+        backstories=_CODE_QUALITY_BACKSTORIES,
+        tools=('actor_code',),
+    ),
+    'actor_definition_quality': _AgentSpec(
         role='Apify Actor definition evaluator',
-        goal=(
-            "Assess the quality of an Apify Actor's documentation and usability by analyzing its README clarity, "
-            'input properties, ease of use, example provision, and GitHub link visibility.'
-            f'{PEDANTIC_MESSAGE if pedantic else ""}'
-            f'{SUGGESTIONS_MESSAGE}'
-        ),
-        backstory=(
-            "I'm a meticulous Apify expert with years of experience reviewing Actors for usability and documentation "
-            'excellence. Using tools to fetch READMEs and input schemas, I ensure Actors are intuitive and '
-            'well-documented, helping users adopt them seamlessly while meeting Apify Store standards.'
-            f'{PEDANTIC_MESSAGE_BACKSTORY if pedantic else ""}'
-        ),
-        tools=tools,
+        goals=_ACTOR_DEFINITION_GOALS,
+        backstories=_ACTOR_DEFINITION_BACKSTORIES,
+        tools=('actor_input_schema', 'actor_readme'),
+    ),
+    'uniqueness_check': _AgentSpec(
+        role='Apify Actor uniqueness expert',
+        goals=_UNIQUENESS_GOALS,
+        backstories=_UNIQUENESS_BACKSTORIES,
+        tools=('actor_readme', 'search_related_actors'),
+    ),
+    'pricing_check': _AgentSpec(
+        role='Apify pricing expert',
+        goals=_PRICING_GOALS,
+        backstories=_PRICING_BACKSTORIES,
+        tools=('actor_pricing_info', 'search_related_actors'),
+    ),
+}
+
+
+@lru_cache(maxsize=32)
+def _agent_prototype(kind: str, llm: str | LLM, debug: bool, pedantic: bool) -> Agent:
+    """Construct and cache the fully validated prototype agent for one configuration."""
+    spec = _AGENT_SPECS[kind]
+    tools = _shared_tools()
+    return _agent_class()(
+        role=spec.role,
+        goal=spec.goals[pedantic],
+        backstory=spec.backstories[pedantic],
+        tools=[tools[name] for name in spec.tools],
+        allow_delegation=spec.allow_delegation,
         verbose=debug,
         llm=llm,
     )
 
 
-def create_uniqueness_check_agent(llm: str, debug: bool = False, pedantic: bool = False) -> Agent:
+def build_agent(kind: str, llm: str | LLM, debug: bool = False, pedantic: bool = False) -> Agent:
     """
-    Create an Agent instance configured for code quality inspection.
+    Build an Agent instance from the spec table for the given agent kind.
+
+    The expensive construction and validation happen once per configuration in
+    the cached prototype; every call returns a fresh copy of it, because
+    Crew.kickoff mutates agents in place (crew backref, executor, task state)
+    and concurrent inspections must not share those.
 
     Args:
-        llm (str): LLM model name.
+        kind (str): Agent kind, one of the _AGENT_SPECS keys.
+        llm (str | LLM): LLM model name or a preconfigured crewai LLM instance.
         debug (bool): If True, the agent will operate in verbose mode for debugging purposes.
         pedantic (bool): If True, the agent will be more pedantic.
+
     Returns:
-        Agent: An instance of the Agent class configured for code quality inspection.
+        Agent: An instance of the Agent class configured for the given kind.
     """
-    tools = [GetActorReadmeTool(), SearchRelatedActorsTool()]
-    return Agent(
-        role='Apify Actor uniqueness expert',
-        goal=(
-            'Compare an Actors functionality and uniqueness by reading its README and '
-            'searching related Actors using keywords.\n'
-            'Provide a very short report with one of these grades:\n'
-            'GREAT (unique), GOOD (some similarity), BAD (similar to others).\n'
-            'Always explain (briefly!) functional differences.\n\n'
-            'Example output:\n'
-            'Actor: apify/instagram-scraper\n'
-            'Uniqueness score: GOOD\n'
-            'Explanation: There are some Instagram Actors offering similar functionality.\n'
-        ),
-        backstory=(
-            'I am an Apify expert familiar with the platform and its Actors.\n'
-            'My tools include retrieving Actor README and performing full-text searches to '
-            'find related Actors. I need to execute search multiple times with different sets '
-            'of keywords. I need to gather at least a couple of related Actors to provide a good comparison.'
-            f'{PEDANTIC_MESSAGE_BACKSTORY if pedantic else ""}'
-        ),
-        tools=tools,
-        verbose=debug,
-        llm=llm,
-    )
+    return _agent_prototype(kind, llm, debug, pedantic).model_copy()
 
 
-def create_pricing_check_agent(llm: str, debug: bool = False, pedantic: bool = False) -> Agent:
-    """
-    Create an Agent instance configured for pricing comparison of Apify Actors.
+def create_actor_inspector_agent(llm: str | LLM, debug: bool = False, pedantic: bool = False) -> Agent:
+    """Create the Agent instance configured for project management."""
+    return build_agent('actor_inspector', llm, debug=debug, pedantic=pedantic)
 
-    Args:
-        llm (str): LLM model name.
-        debug (bool): If True, the agent will operate in verbose mode.
-        pedantic (bool): If True, the agent will be more pedantic.
 
-    Returns:
-        Agent: An instance of the Agent class configured for pricing analysis.
-    """
-    tools = [GetActorPricingInfoTool(), SearchRelatedActorsTool()]
-    return Agent(
-        role='Apify pricing expert',
-        goal=(
-            "Compare an Actor's pricing by retrieving its pricing information and "
-            'searching for related Actors using keywords.\n'
-            'Apify pricing models:\n'
-            '- 5$ Free Plan: Use selected Actors free of charge, paying only platform usage costs.\n'
-            '- Rental Model: After a trial, pay a flat monthly fee; developers receive 80% of the fees.\n'
-            '- Pay-per-Result: Pay only for the results produced, with no extra usage fees.\n'
-            '- Pay-per-Event: Pay for each specific action or event.\n'
-            '- Pay-per-Usage: Pay based on the Apify platform usage generated when running the Actor.\n'
-            'Provide a very short report with one of these ratings:\n'
-            'GREAT (competitive pricing), GOOD (moderate), BAD (expensive).\n'
-            f'{PEDANTIC_MESSAGE if pedantic else ""}'
-            f'{SUGGESTIONS_MESSAGE}'
-            'Include a brief explanation;\n\n'
-            'Example output:\n'
-            'Actor: apify/xyz-actor\n'
-            'Pricing rating: GOOD\n'
-            'Explanation: The price per event is moderate compared to similar Actors.\n'
-        ),
-        backstory=(
-            'I am an Apify expert specialized in pricing analysis. My tools help retrieve pricing details and perform'
-            'full-text searches to find related Actors. I evaluate overall pricing competitiveness.\n'
-            'I am able to perform multiple searches with different sets of keywords.\n'
-            'I am able to compare different pricing models. For example, when an Actor is paid per platform usage, '
-            "I need to retrieve Apify's pricing plans for the platform and compare them with other pricing models.\n"
-            f'{PEDANTIC_MESSAGE_BACKSTORY if pedantic else ""}'
-        ),
-        tools=tools,
-        verbose=debug,
-        llm=llm,
-    )
+def create_code_quality_agent(llm: str | LLM, debug: bool = False, pedantic: bool = False) -> Agent:
+    """Create the Agent instance configured for code quality inspection."""
+    return build_agent('code_quality', llm, debug=debug, pedantic=pedantic)
+
+
+def create_actor_definition_quality_agent(llm: str | LLM, debug: bool = False, pedantic: bool = False) -> Agent:
+    """Create the Agent instance configured for Apify Actor definition quality inspection."""
+    return build_agent('actor_definition_quality', llm, debug=debug, pedantic=pedantic)
+
+
+def create_uniqueness_check_agent(llm: str | LLM, debug: bool = False, pedantic: bool = False) -> Agent:
+    """Create the Agent instance configured for Actor uniqueness comparison."""
+    return build_agent('uniqueness_check', llm, debug=debug, pedantic=pedantic)
+
+
+def create_pricing_check_agent(llm: str | LLM, debug: bool = False, pedantic: bool = False) -> Agent:
+    """Create the Agent instance configured for pricing comparison of Apify Actors."""
+    return build_agent('pricing_check', llm, debug=debug, pedantic=pedantic)
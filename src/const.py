@@ -1,4 +1,5 @@
 REQUESTS_TIMEOUT_SECS: float = 10.0
+MAX_CONCURRENT_INSPECTIONS = 4
 PEDANTIC_MESSAGE = 'Conduct an extremely thorough and detailed analysis with strict attention to every aspect. '
 PEDANTIC_MESSAGE_BACKSTORY = ('I am a perfectionist who examines every detail with meticulous care,'
                               ' similar to a skilled detective.')
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import math
 
 from apify import Actor
-from crewai import Crew, Task  # type: ignore[import-untyped]
+from crewai import LLM, Crew, Task  # type: ignore[import-untyped]
 
 from src.agents import (
     create_actor_definition_quality_agent,
@@ -15,7 +15,266 @@ from src.agents import (
     create_pricing_check_agent,
     create_uniqueness_check_agent,
 )
-from src.const import PEDANTIC_MESSAGE
+from src.const import MAX_CONCURRENT_INSPECTIONS, PEDANTIC_MESSAGE
+from src.models import ActorInput
+
+logger = logging.getLogger('apify')
+
+# Task prompt templates are built once at import; per run only the pedantic
+# snippet, the Actor name and (for the final task) the specialist reports are
+# interpolated via str.format. Keeping the static block first preserves the
+# shared provider prompt-cache prefix.
+CODE_QUALITY_TASK_DESCRIPTION = (
+    'Analyze the code quality of an Apify Actor.\n'
+    'If code is not available, skip all code-related tools '
+    'and explicitly state that the code cannot be evaluated, '
+    'assigning an "N/A" grade. '
+    'Evaluate the following criteria:\n'
+    '- **Tests**: Are tests present? Rate as "bad" (no tests), "good" '
+    '(some tests, missing major functionality), or "great" (most '
+    'key functionality tested). Explain briefly.\n'
+    '- **Linter**: Is a linter enabled? Rate as "bad" (not enabled), '
+    '"good" (partially enabled), or "great" (fully enabled). Explain '
+    'briefly.\n'
+    '- **Code smells**: Are there code smells (e.g., duplication)? '
+    'Rate as "bad" (many), "good" (some), or "great" (none). Explain '
+    'briefly.\n'
+    '- **Security**: Are there visible security vulnerabilities '
+    '(e.g., outdated dependencies)? Rate as "bad" (many), "good" '
+    '(some), or "great" (none). Explain briefly.\n'
+    '- **Performance**: Are there performance issues (e.g., '
+    'inefficient loops)? Rate as "bad" (many), "good" (some), or '
+    '"great" (none). Explain briefly.\n'
+    '- **Style**: Are there code style issues (e.g., inconsistent '
+    'naming)? Rate as "bad" (many), "good" (some), or "great" (none). '
+    'Explain briefly.\n'
+    '{pedantic_message}'
+    'The Actor to analyze is "{actor_name}".'
+)
+
+CODE_QUALITY_TASK_EXPECTED_OUTPUT = (
+    'A structured report in markdown format with:\n'
+    '- A section for each criterion (Tests, Linter, Code smells, '
+    'Security, Performance, Style).\n'
+    '- Each section includes a rating ("bad", "good", "great" or '
+    '"N/A" if no URL) and a 1-2 sentence explanation.\n'
+    '- A brief list of suggestions for improvement if applicable.\n'
+    '- A brief overall summary (2-3 sentences) with suggestions for '
+    'improvement if applicable.'
+)
+
+ACTOR_QUALITY_TASK_DESCRIPTION = (
+    'Assess the quality of an Apify Actor based on its '
+    'documentation and usability. '
+    'Evaluate the following criteria:\n'
+    '- **README clarity**: Is the README well-defined? Rate as "bad" '
+    '(poorly defined), "good" (partially clear), or "great" (fully '
+    'detailed). Explain briefly.\n'
+    '- **Input properties**: Are input properties clear and logical? '
+    'Rate as "bad" (unclear), "good" (partially clear), or "great" '
+    '(well-defined). Explain briefly.\n'
+    '- **Usability**: Is the Actor easy to use based on the README? '
+    'Rate as "bad" (confusing), "good" (somewhat clear), or "great" '
+    '(very intuitive). Explain briefly.\n'
+    '- **Examples**: Are usage examples provided? Rate as "bad" '
+    '(none), "good" (some), or "great" (comprehensive). Explain '
+    'briefly.\n'
+    '- **GitHub link**: Is the GitHub link in the README? Rate as '
+    '"bad" (missing), "good" (present but not prominent), or "great" '
+    '(clearly visible). Explain briefly.\n'
+    '{pedantic_message}'
+    'The Actor to assess is "{actor_name}".'
+)
+
+ACTOR_QUALITY_TASK_EXPECTED_OUTPUT = (
+    'A structured report in markdown format with:\n'
+    '- A section for each criterion (README clarity, Input '
+    'properties, Usability, Examples, GitHub link).\n'
+    '- Each section includes a rating ("bad", "good", "great") and a '
+    '1-2 sentence explanation.\n'
+    '- A brief list of suggestions for improvement if applicable.\n'
+    '- A brief overall summary (2-3 sentences) with suggestions for '
+    'improvement.'
+)
+
+UNIQUENESS_TASK_DESCRIPTION = (
+    'Evaluate the uniqueness of an Apify Actor '
+    'compared to similar actors. '
+    'Assess the following criteria:\n'
+    '- **Comparison**: Is the Actor unique compared to peers? Rate '
+    'as "bad" (very similar), "good" (somewhat unique), or "great" '
+    '(highly distinct). Explain briefly.\n'
+    '- **Functionality**: Does it offer unique features? Rate as '
+    '"bad" (none), "good" (some), or "great" (highly unique). Explain '
+    'briefly.\n'
+    '- **Selling points**: Are there standout selling points? Rate '
+    'as "bad" (none), "good" (some), or "great" (multiple). Explain '
+    'briefly.\n'
+    '{pedantic_message}'
+    'The Actor to evaluate is "{actor_name}".'
+)
+
+UNIQUENESS_TASK_EXPECTED_OUTPUT = (
+    'A structured report in markdown format with:\n'
+    '- A section for each criterion (Comparison, Functionality, '
+    'Selling points).\n'
+    '- Each section includes a rating ("bad", "good", "great") and a '
+    '1-2 sentence explanation.\n'
+    '- A brief overall summary (2-3 sentences) highlighting unique '
+    'aspects and improvement ideas.'
+)
+
+PRICING_TASK_DESCRIPTION = (
+    'Analyze the pricing of an Apify Actor for '
+    'competitiveness and sensibility. '
+    'Evaluate the following criteria:\n'
+    '- **Competitiveness**: Is pricing competitive with similar '
+    'Actors? Rate as "bad" (expensive), "good" (moderate), or "great" '
+    '(highly competitive). Explain briefly.\n'
+    '- **Sensibility**: Does the pricing align with functionality? '
+    'Rate as "bad" (not sensible), "good" (somewhat sensible), or '
+    '"great" (very sensible). Explain briefly.\n'
+    '- **Transparency**: Are there hidden costs? Rate as "bad" '
+    '(many), "good" (some), or "great" (none). Explain briefly.\n'
+    '{pedantic_message}'
+    'The Actor to analyze is "{actor_name}".'
+)
+
+PRICING_TASK_EXPECTED_OUTPUT = (
+    'A structured report in markdown format with:\n'
+    '- A section for each criterion (Competitiveness, Sensibility, '
+    'Transparency).\n'
+    '- Each section includes a rating ("bad", "good", "great") and a '
+    '1-2 sentence explanation.\n'
+    '- A brief list of suggestions for improvement if applicable.\n'
+    '- A brief overall summary (2-3 sentences) with pricing '
+    'improvement suggestions.'
+)
+
+FINAL_TASK_DESCRIPTION = (
+    'Compile a final quality assessment for an Apify Actor. '
+    'Include the Actor name and a brief summary of its purpose. '
+    'Always Actor not Actor.'
+    'Summarize findings from previous tasks and assign an overall '
+    'rating:\n'
+    '- **Code quality**: Summarize code quality findings. Rate as '
+    '"bad", "good", or "great". Explain in 1-2 sentences.\n'
+    '- **Actor quality**: Summarize Actor quality findings. Rate as '
+    '"bad", "good", or "great". Explain in 1-2 sentences.\n'
+    '- **Uniqueness**: Summarize uniqueness findings. Rate as "bad", '
+    '"good", or "great". Explain in 1-2 sentences.\n'
+    '- **Pricing**: Summarize pricing findings. Rate as "bad", '
+    '"good", or "great". Explain in 1-2 sentences.\n'
+    '- **Overall**: Provide a final rating ("bad", "good", "great") '
+    'with a 2-3 sentence justification.\n'
+    '{pedantic_message}'
+    'The Actor to assess is "{actor_name}".\n\n'
+    'Reports from the specialist agents:\n\n'
+    '{specialist_reports}'
+)
+
+FINAL_TASK_EXPECTED_OUTPUT = (
+    'A concise final report in markdown format with:\n'
+    '- A header section including the Actor Name and a brief Summary '
+    'of what the Actor does (2-3 sentences).\n'
+    '- A section for each category (Code quality, Actor quality, '
+    'Uniqueness, Pricing, Suggestions, Overall).\n'
+    '- Each section includes a rating ("bad", "good", "great") and a '
+    '1-2 sentence explanation.\n'
+    '- The Suggestions section provides a list of suggestions for improvement.\n'
+    '- The Overall section provides a final rating and a 2-3 sentence summary.'
+)
+
+
+async def inspect_actor(actor_name: str, llm: LLM, debug: bool = False, pedantic: bool = False) -> tuple[str, int]:
+    """Run the full inspection pipeline for a single Actor.
+
+    Args:
+        actor_name (str): The name of the Apify Actor to inspect.
+        llm (LLM): Preconfigured crewai LLM instance.
+        debug (bool): If True, the agents will operate in verbose mode.
+        pedantic (bool): If True, the agents will be more pedantic.
+
+    Returns:
+        tuple[str, int]: The final report and the total number of LLM tokens used.
+    """
+    # Only two variants exist, so resolve the snippet once instead of
+    # re-running the branch in every task description below.
+    pedantic_message = PEDANTIC_MESSAGE if pedantic else ''
+
+    inspector_agent = create_actor_inspector_agent(llm, debug=debug, pedantic=pedantic)
+    code_quality_agent = create_code_quality_agent(llm, debug=debug, pedantic=pedantic)
+    actor_quality_agent = create_actor_definition_quality_agent(llm, debug=debug, pedantic=pedantic)
+    uniqueness_check_agent = create_uniqueness_check_agent(llm, debug=debug, pedantic=pedantic)
+    pricing_check_agent = create_pricing_check_agent(llm, debug=debug, pedantic=pedantic)
+
+    code_quality_task = Task(
+        description=CODE_QUALITY_TASK_DESCRIPTION.format(pedantic_message=pedantic_message, actor_name=actor_name),
+        expected_output=CODE_QUALITY_TASK_EXPECTED_OUTPUT,
+        agent=code_quality_agent,
+    )
+
+    actor_quality_task = Task(
+        description=ACTOR_QUALITY_TASK_DESCRIPTION.format(pedantic_message=pedantic_message, actor_name=actor_name),
+        expected_output=ACTOR_QUALITY_TASK_EXPECTED_OUTPUT,
+        agent=actor_quality_agent,
+    )
+
+    uniqueness_task = Task(
+        description=UNIQUENESS_TASK_DESCRIPTION.format(pedantic_message=pedantic_message, actor_name=actor_name),
+        expected_output=UNIQUENESS_TASK_EXPECTED_OUTPUT,
+        agent=uniqueness_check_agent,
+    )
+
+    pricing_task = Task(
+        description=PRICING_TASK_DESCRIPTION.format(pedantic_message=pedantic_message, actor_name=actor_name),
+        expected_output=PRICING_TASK_EXPECTED_OUTPUT,
+        agent=pricing_check_agent,
+    )
+
+    # The four analysis tasks are independent LLM + tool workloads blocked
+    # mostly on network I/O, so run them as concurrent single-agent crews
+    # instead of chaining them serially through the manager.
+    specialist_crews = [
+        Crew(agents=[agent], tasks=[task])
+        for agent, task in (
+            (actor_quality_agent, actor_quality_task),
+            (code_quality_agent, code_quality_task),
+            (pricing_check_agent, pricing_task),
+            (uniqueness_check_agent, uniqueness_task),
+        )
+    ]
+    Actor.log.info('Kicking off the specialist crews for %s...', actor_name)
+    specialist_outputs = await asyncio.gather(*(crew.kickoff_async() for crew in specialist_crews))
+    specialist_reports = '\n\n'.join(output.raw for output in specialist_outputs)
+
+    final_task = Task(
+        description=FINAL_TASK_DESCRIPTION.format(
+            pedantic_message=pedantic_message,
+            actor_name=actor_name,
+            specialist_reports=specialist_reports,
+        ),
+        expected_output=FINAL_TASK_EXPECTED_OUTPUT,
+        agent=inspector_agent,
+    )
+
+    # Create a one-man crew for the final synthesis
+    # For more information, see https://docs.crewai.com/concepts/crews
+    crew = Crew(
+        agents=[inspector_agent],
+        tasks=[final_task],
+    )
+
+    # Kick off the crew and get the response
+    Actor.log.info('Kicking off the final crew for %s...', actor_name)
+    crew_output = await crew.kickoff_async()
+    raw_response = crew_output.raw
+    Actor.log.debug('Raw response: %s', raw_response[:2000])
+
+    total_tokens = crew_output.token_usage.total_tokens + sum(
+        output.token_usage.total_tokens for output in specialist_outputs
+    )
+    return raw_response, total_tokens
 
 
 async def main() -> None:
@@ -30,226 +289,71 @@ async def main() -> None:
     """
     async with Actor:
         Actor.log.info('Starting Actor Inspector Agent')
-        count = math.ceil((Actor.get_env().get('memory_mbytes', 1024) or 1024) // 1024)
+        memory_mbytes = Actor.get_env().get('memory_mbytes') or 1024
+        # Ceiling division; the previous math.ceil around // floored first and
+        # under-charged non-multiples of 1 GB.
+        count = -(-memory_mbytes // 1024)
         await Actor.charge(event_name='actor-start-gb', count=count)
         Actor.log.info('Charged for Actor start %d GB', count)
 
-        actor_input = await Actor.get_input() or {}
-        Actor.log.info('Received input: %s', actor_input)
+        actor_input = ActorInput.model_validate(await Actor.get_input() or {})
+        Actor.log.debug('Received input: %s', actor_input)
 
-        if not (actor_name := actor_input.get('actorName')):
+        # A single actorName or a list in actorNames; a batch shares the warm
+        # agents, clients and caches and runs the inspections concurrently.
+        # A name present in both fields is inspected (and charged) once.
+        actor_names = [*actor_input.actor_names]
+        if actor_input.actor_name:
+            actor_names.append(actor_input.actor_name)
+        actor_names = list(dict.fromkeys(actor_names))
+        if not actor_names:
             await Actor.fail(
-                status_message='Missing the "actorName" attribute in the input!'
-                ' Please provide the name of the actor in the form of user-name/actor-name.',
+                status_message='Missing both the "actorName" and "actorNames" attributes in the input!'
+                ' Please provide at least one Actor name in the form of user-name/actor-name.',
             )
 
-        pedantic = actor_input.get('pedantic', True)
-        model_name = actor_input.get('modelName', 'gpt-4o-mini')
-        if debug := actor_input.get('debug', True):
+        pedantic = actor_input.pedantic
+        model_name = actor_input.model_name
+        # Prompt templates keep their static prefix first (see the task
+        # constants above), so providers with implicit prefix caching still
+        # benefit; explicit cache_control injection needs a newer litellm.
+        llm = LLM(model=model_name)
+        if debug := actor_input.debug:
             Actor.log.setLevel(logging.DEBUG)
-            logger = logging.getLogger('apify')
             logger.setLevel(logging.DEBUG)
 
-        inspector_agent = create_actor_inspector_agent(model_name, debug=debug, pedantic=pedantic)
-        code_quality_agent = create_code_quality_agent(model_name, debug=debug, pedantic=pedantic)
-        actor_quality_agent = create_actor_definition_quality_agent(model_name, debug=debug, pedantic=pedantic)
-        uniqueness_check_agent = create_uniqueness_check_agent(model_name, debug=debug, pedantic=pedantic)
-        pricing_check_agent = create_pricing_check_agent(model_name, debug=debug, pedantic=pedantic)
-
-        code_quality_task = Task(
-            description=(
-                f'Analyze the code quality of the Apify Actor "{actor_name}"\n'
-                'If code is not available, skip all code-related tools '
-                'and explicitly state that the code cannot be evaluated, '
-                'assigning an "N/A" grade. '
-                f'{PEDANTIC_MESSAGE if pedantic else ""}'
-                'Evaluate the following criteria:\n'
-                '- **Tests**: Are tests present? Rate as "bad" (no tests), "good" '
-                '(some tests, missing major functionality), or "great" (most '
-                'key functionality tested). Explain briefly.\n'
-                '- **Linter**: Is a linter enabled? Rate as "bad" (not enabled), '
-                '"good" (partially enabled), or "great" (fully enabled). Explain '
-                'briefly.\n'
-                '- **Code smells**: Are there code smells (e.g., duplication)? '
-                'Rate as "bad" (many), "good" (some), or "great" (none). Explain '
-                'briefly.\n'
-                '- **Security**: Are there visible security vulnerabilities '
-                '(e.g., outdated dependencies)? Rate as "bad" (many), "good" '
-                '(some), or "great" (none). Explain briefly.\n'
-                '- **Performance**: Are there performance issues (e.g., '
-                'inefficient loops)? Rate as "bad" (many), "good" (some), or '
-                '"great" (none). Explain briefly.\n'
-                '- **Style**: Are there code style issues (e.g., inconsistent '
-                'naming)? Rate as "bad" (many), "good" (some), or "great" (none). '
-                'Explain briefly.\n'
-            ),
-            expected_output=(
-                'A structured report in markdown format with:\n'
-                '- A section for each criterion (Tests, Linter, Code smells, '
-                'Security, Performance, Style).\n'
-                '- Each section includes a rating ("bad", "good", "great" or '
-                '"N/A" if no URL) and a 1-2 sentence explanation.\n'
-                '- A brief list of suggestions for improvement if applicable.\n'
-                '- A brief overall summary (2-3 sentences) with suggestions for '
-                'improvement if applicable.'
-            ),
-            agent=code_quality_agent,
-        )
-
-        actor_quality_task = Task(
-            description=(
-                f'Assess the quality of the Apify Actor "{actor_name}" based on its '
-                'documentation and usability. '
-                f'{PEDANTIC_MESSAGE if pedantic else ""}'
-                'Evaluate the following criteria:\n'
-                '- **README clarity**: Is the README well-defined? Rate as "bad" '
-                '(poorly defined), "good" (partially clear), or "great" (fully '
-                'detailed). Explain briefly.\n'
-                '- **Input properties**: Are input properties clear and logical? '
-                'Rate as "bad" (unclear), "good" (partially clear), or "great" '
-                '(well-defined). Explain briefly.\n'
-                '- **Usability**: Is the Actor easy to use based on the README? '
-                'Rate as "bad" (confusing), "good" (somewhat clear), or "great" '
-                '(very intuitive). Explain briefly.\n'
-                '- **Examples**: Are usage examples provided? Rate as "bad" '
-                '(none), "good" (some), or "great" (comprehensive). Explain '
-                'briefly.\n'
-                '- **GitHub link**: Is the GitHub link in the README? Rate as '
-                '"bad" (missing), "good" (present but not prominent), or "great" '
-                '(clearly visible). Explain briefly.'
-            ),
-            expected_output=(
-                'A structured report in markdown format with:\n'
-                '- A section for each criterion (README clarity, Input '
-                'properties, Usability, Examples, GitHub link).\n'
-                '- Each section includes a rating ("bad", "good", "great") and a '
-                '1-2 sentence explanation.\n'
-                '- A brief list of suggestions for improvement if applicable.\n'
-                '- A brief overall summary (2-3 sentences) with suggestions for '
-                'improvement.'
-            ),
-            agent=actor_quality_agent,
-        )
-
-        uniqueness_task = Task(
-            description=(
-                f'Evaluate the uniqueness of the Apify Actor "{actor_name}" '
-                'compared to similar actors. '
-                f'{PEDANTIC_MESSAGE if pedantic else ""}'
-                'Assess the following criteria:\n'
-                '- **Comparison**: Is the Actor unique compared to peers? Rate '
-                'as "bad" (very similar), "good" (somewhat unique), or "great" '
-                '(highly distinct). Explain briefly.\n'
-                '- **Functionality**: Does it offer unique features? Rate as '
-                '"bad" (none), "good" (some), or "great" (highly unique). Explain '
-                'briefly.\n'
-                '- **Selling points**: Are there standout selling points? Rate '
-                'as "bad" (none), "good" (some), or "great" (multiple). Explain '
-                'briefly.'
-            ),
-            expected_output=(
-                'A structured report in markdown format with:\n'
-                '- A section for each criterion (Comparison, Functionality, '
-                'Selling points).\n'
-                '- Each section includes a rating ("bad", "good", "great") and a '
-                '1-2 sentence explanation.\n'
-                '- A brief overall summary (2-3 sentences) highlighting unique '
-                'aspects and improvement ideas.'
-            ),
-            agent=uniqueness_check_agent,
-        )
-
-        pricing_task = Task(
-            description=(
-                f'Analyze the pricing of the Apify Actor "{actor_name}" for '
-                'competitiveness and sensibility. '
-                f'{PEDANTIC_MESSAGE if pedantic else ""}'
-                'Evaluate the following criteria:\n'
-                '- **Competitiveness**: Is pricing competitive with similar '
-                'Actors? Rate as "bad" (expensive), "good" (moderate), or "great" '
-                '(highly competitive). Explain briefly.\n'
-                '- **Sensibility**: Does the pricing align with functionality? '
-                'Rate as "bad" (not sensible), "good" (somewhat sensible), or '
-                '"great" (very sensible). Explain briefly.\n'
-                '- **Transparency**: Are there hidden costs? Rate as "bad" '
-                '(many), "good" (some), or "great" (none). Explain briefly.'
-            ),
-            expected_output=(
-                'A structured report in markdown format with:\n'
-                '- A section for each criterion (Competitiveness, Sensibility, '
-                'Transparency).\n'
-                '- Each section includes a rating ("bad", "good", "great") and a '
-                '1-2 sentence explanation.\n'
-                '- A brief list of suggestions for improvement if applicable.\n'
-                '- A brief overall summary (2-3 sentences) with pricing '
-                'improvement suggestions.'
-            ),
-            agent=pricing_check_agent,
-        )
-
-        final_task = Task(
-            description=(
-                f'Compile a final quality assessment for the Apify Actor '
-                f'"{actor_name}". '
-                'Include the Actor name and a brief summary of its purpose. '
-                'Always Actor not Actor.'
-                f'{PEDANTIC_MESSAGE if pedantic else ""}'
-                'Summarize findings from previous tasks and assign an overall '
-                'rating:\n'
-                '- **Code quality**: Summarize code quality findings. Rate as '
-                '"bad", "good", or "great". Explain in 1-2 sentences.\n'
-                '- **Actor quality**: Summarize Actor quality findings. Rate as '
-                '"bad", "good", or "great". Explain in 1-2 sentences.\n'
-                '- **Uniqueness**: Summarize uniqueness findings. Rate as "bad", '
-                '"good", or "great". Explain in 1-2 sentences.\n'
-                '- **Pricing**: Summarize pricing findings. Rate as "bad", '
-                '"good", or "great". Explain in 1-2 sentences.\n'
-                '- **Overall**: Provide a final rating ("bad", "good", "great") '
-                'with a 2-3 sentence justification.'
-            ),
-            expected_output=(
-                'A concise final report in markdown format with:\n'
-                '- A header section including the Actor Name and a brief Summary '
-                'of what the Actor does (2-3 sentences).\n'
-                '- A section for each category (Code quality, Actor quality, '
-                'Uniqueness, Pricing, Suggestions, Overall).\n'
-                '- Each section includes a rating ("bad", "good", "great") and a '
-                '1-2 sentence explanation.\n'
-                '- The Suggestions section provides a list of suggestions for improvement.\n'
-                '- The Overall section provides a final rating and a 2-3 sentence summary.'
-            ),
-            context=[actor_quality_task, code_quality_task, pricing_task, uniqueness_task],
-            agent=inspector_agent,
-        )
+        # Cap batch concurrency so a large actorNames list does not spawn an
+        # unbounded number of crews (and their LLM calls) at once.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_INSPECTIONS)
 
-        # Create a one-man crew
-        # For more information, see https://docs.crewai.com/concepts/crews
-        crew = Crew(
-            agents=[
-                actor_quality_agent,
-                code_quality_agent,
-                pricing_check_agent,
-                uniqueness_check_agent,
-            ],
-            tasks=[final_task],
-            manager_agent=inspector_agent,
-        )
+        async def bounded_inspect(name: str) -> tuple[str, int]:
+            async with semaphore:
+                return await inspect_actor(name, llm, debug=debug, pedantic=pedantic)
 
-        # Kick off the crew and get the response
-        Actor.log.info('Kicking off the crew...')
-        crew_output = crew.kickoff()
-        raw_response = crew_output.raw
-        Actor.log.debug('Raw response: %s', raw_response)
+        # One failed inspection must not discard the others' finished (and
+        # already billed) LLM work, so collect exceptions instead of aborting.
+        results = await asyncio.gather(*(bounded_inspect(name) for name in actor_names), return_exceptions=True)
 
-        total_tokens = crew_output.token_usage.total_tokens
+        reports = []
+        total_tokens = 0
+        for name, result in zip(actor_names, results, strict=True):
+            if isinstance(result, BaseException):
+                Actor.log.error('Inspection of %s failed: %s', name, result)
+                continue
+            raw_response, tokens = result
+            total_tokens += tokens
+            reports.append({'actorId': name, 'response': raw_response})
         Actor.log.debug('Total tokens used: %d', total_tokens)
 
-        await Actor.push_data(
-            {
-                'actorId': actor_name,
-                'response': raw_response,
-            }
+        if not reports:
+            await Actor.fail(status_message='All Actor inspections failed, see the run log for details.')
+            return
+
+        # The dataset push and the completion charge are independent platform
+        # calls, so overlap them instead of awaiting serially. Only completed
+        # inspections are pushed and charged.
+        await asyncio.gather(
+            Actor.push_data(reports),
+            Actor.charge(event_name='task-completed', count=len(reports)),
         )
-        Actor.log.info('Pushed the data into the dataset!')
-        await Actor.charge(event_name='task-completed', count=1)
-        Actor.log.info('Charged for task completed')
+        Actor.log.info('Pushed the data into the dataset and charged for completed tasks!')
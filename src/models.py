@@ -18,6 +18,27 @@ config_to_camel = ConfigDict(
     from_attributes=True,
 )
 
+# Variant for models instantiated in bulk from Apify API responses: they are
+# read-only snapshots of API data, so freeze them to catch accidental mutation
+# after validation.
+config_to_camel_frozen = ConfigDict(
+    alias_generator=to_camel,
+    populate_by_name=True,
+    from_attributes=True,
+    frozen=True,
+)
+
+
+class ActorInput(BaseModel):
+    """Validated Actor input, parsed once at the start of a run."""
+
+    actor_name: str | None = None
+    actor_names: list[str] = Field(default_factory=list)
+    pedantic: bool = True
+    model_name: str = 'gpt-4o-mini'
+    debug: bool = True
+    model_config = config_to_camel
+
 
 class FinalTaskSection(BaseModel):
     """Pydantic model for each section evaluated for the final task."""
@@ -104,7 +125,7 @@ class Stats(BaseModel):
     total_runs: int | None = None
     total_users30_days: int | None = None
     public_actor_run_stats30_days: dict | None = None
-    model_config = config_to_camel
+    model_config = config_to_camel_frozen
 
 
 # Nested model for 'pricingInfos'
@@ -112,12 +133,12 @@ class ActorChargeEvent(BaseModel):
     event_description: str
     event_price_usd: float
     event_title: str
-    model_config = config_to_camel
+    model_config = config_to_camel_frozen
 
 
 class PricingPerEvent(BaseModel):
     actor_charge_events: dict[str, ActorChargeEvent] | None = None
-    model_config = config_to_camel
+    model_config = config_to_camel_frozen
 
 
 class PricingInfo(BaseModel):
@@ -129,7 +150,7 @@ class PricingInfo(BaseModel):
     apify_margin_percentage: float | None = None
     minimal_max_total_charge_usd: float | None = None
     pricing_per_event: PricingPerEvent | None = None
-    model_config = config_to_camel
+    model_config = config_to_camel_frozen
 
 
 class ActorStore(BaseModel):
@@ -143,7 +164,7 @@ class ActorStore(BaseModel):
     current_pricing_info: PricingInfo | None = None
     url: str | None = None
     total_stars: int | None = None
-    model_config = config_to_camel
+    model_config = config_to_camel_frozen
 
 
 class ActorStoreList(RootModel):
@@ -8,40 +8,135 @@ To learn how to create a new tool, see:
 
 from __future__ import annotations
 
+import bisect
 import datetime
 import logging
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode, urlparse
 
-import requests
-from apify_client import ApifyClient
 from crewai.tools import BaseTool  # type: ignore[import-untyped]
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from src.const import REQUESTS_TIMEOUT_SECS
-from src.models import ActorInputDefinition, ActorInputProperty, ActorStoreList, CodeContext, CodeFile, PricingInfo
+from src.models import (
+    ActorInputDefinition,
+    ActorInputProperty,
+    ActorStore,
+    ActorStoreList,
+    CodeContext,
+    CodeFile,
+    PricingInfo,
+)
 from src.utils import (
     generate_file_tree,
     get_actor_github_urls,
     get_actor_latest_build,
     get_actor_source_files,
-    get_apify_token,
-    github_repo_exists,
+    get_apify_client,
+    get_http_session,
+    json_loads,
 )
 
 logger = logging.getLogger('apify')
 
-UITHUB_LINK = 'https://uithub.com/{repo_path}?accept=application/json&maxTokens={max_tokens}'
+UITHUB_LINK = 'https://uithub.com/{repo_path}?{params}'
+
+# Ask UIthub to drop lockfiles server-side: they are often the largest blobs in
+# a repo and would be discarded locally anyway. The local basename filter below
+# stays as the safety net for everything the server cannot exclude.
+UITHUB_PARAMS = {'accept': 'application/json', 'excludeExt': 'lock'}
+
+IGNORE_FILES = frozenset(
+    {
+        'license',
+        'package-lock.json',
+        'yarn.lock',
+        'readme.md',
+        'poetry.lock',
+        'requirements.txt',
+        'setup.py',
+        'uv.lock',
+    }
+)
+
 
-IGNORE_FILES = [
-    'license',
-    'package-lock.json',
-    'yarn.lock',
-    'readme.md',
-    'poetry.lock',
-    'requirements.txt',
-    'setup.py',
-    'uv.lock',
-]
+def _is_ignored_file(name: str) -> bool:
+    """Check whether a repo path is boilerplate we do not want in the code context.
+
+    Matches on the exact basename: a substring check would also drop
+    legitimate source files such as license.py or setup.py.j2.
+    """
+    return name.rsplit('/', 1)[-1].lower() in IGNORE_FILES
+
+
+@lru_cache(maxsize=256)
+def _fetch_actor_readme(actor_name: str) -> str:
+    """Fetch the README of an Actor, cached so agents sharing an Actor do not re-download it."""
+    build = get_actor_latest_build(actor_name)
+    readme = build.get('actorDefinition', {}).get('readme')
+    if not readme:
+        raise ValueError(f'Failed to get the README for the Actor {actor_name}')
+    return str(readme)
+
+
+@lru_cache(maxsize=256)
+def _fetch_actor_pricing_info(actor_name: str) -> PricingInfo | None:
+    """Fetch the current pricing information of an Actor, cached per process."""
+    apify_client = get_apify_client()
+    actor = apify_client.actor(actor_name).get()
+    if not actor:
+        raise ValueError(f'Actor {actor_name} not found.')
+
+    pricing_info = actor.get('pricingInfos')
+    if not pricing_info:
+        return PricingInfo(pricing_model='PAY_PER_PLATFORM_USAGE')
+
+    # pricingInfos is sorted by startedAt ascending (the old linear scan's
+    # break already relied on that), so bisect for the newest entry in effect.
+    # The client normally parses startedAt to an aware datetime, but parse ISO
+    # strings once up front rather than letting them reach the comparison.
+    now = datetime.datetime.now(datetime.UTC)
+    started_at_keys = [
+        datetime.datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+        if isinstance(started_at := pricing_entry.get('startedAt'), str)
+        else started_at
+        for pricing_entry in pricing_info
+    ]
+    index = bisect.bisect_right(started_at_keys, now) - 1
+    current_pricing = pricing_info[index] if index >= 0 else None
+
+    return PricingInfo.model_validate(current_pricing)
+
+
+@lru_cache(maxsize=256)
+def _fetch_actor_input_schema(actor_name: str) -> ActorInputDefinition | str:
+    """Fetch and structure the input schema of an Actor, cached per process."""
+    build = get_actor_latest_build(actor_name)
+
+    if not (actor_definition := build.get('actorDefinition')):
+        raise ValueError(f'Actor definition not found in the Actor build for Actor: {actor_name}')
+
+    if not (actor_input := actor_definition.get('input')):
+        return 'Actor input schema is not available.'
+
+    # Process properties. The payload comes from Apify's own API and is
+    # schema-valid, so skip pydantic validation with model_construct.
+    properties: dict[str, ActorInputProperty] = {}
+    for name, prop in actor_input.get('properties', {}).items():
+        properties[name] = ActorInputProperty.model_construct(
+            title=prop.get('title', ''),
+            description=prop.get('description', ''),
+            type=prop.get('type', ''),
+            # Use prefill value if available, default value otherwise
+            default=prop.get('prefill', prop.get('default')),
+        )
+
+    return ActorInputDefinition.model_construct(
+        title=actor_definition.get('title'),
+        description=actor_definition.get('description'),
+        properties=properties,
+    )
 
 
 class GetActorReadmeInput(BaseModel):
@@ -64,11 +159,7 @@ class GetActorReadmeTool(BaseTool):
             A string containing the README content.
         """
         logger.info('Getting README for Actor %s', actor_name)
-        build = get_actor_latest_build(actor_name)
-        readme = build.get('actorDefinition', {}).get('readme')
-        if not readme:
-            raise ValueError(f'Failed to get the README for the Actor {actor_name}')
-        return str(readme)
+        return _fetch_actor_readme(actor_name)
 
 
 class GetActorInputSchemaInput(BaseModel):
@@ -98,26 +189,7 @@ class GetActorInputSchemaTool(BaseTool):
         Raises:
             ValueError: If the Actor's input schema cannot be retrieved.
         """
-        build = get_actor_latest_build(actor_name)
-
-        if not (actor_definition := build.get('actorDefinition')):
-            raise ValueError(f'Actor definition not found in the Actor build for Actor: {actor_name}')
-
-        if not (actor_input := actor_definition.get('input')):
-            return 'Actor input schema is not available.'
-
-        # Process properties
-        properties: dict[str, ActorInputProperty] = {}
-        for name, prop in actor_input.get('properties', {}).items():
-            # Use prefill value if available, default value otherwise
-            prop['default'] = prop.get('prefill', prop.get('default'))
-            properties[name] = ActorInputProperty(**prop)
-
-        return ActorInputDefinition(
-            title=actor_definition.get('title'),
-            description=actor_definition.get('description'),
-            properties=properties,
-        )
+        return _fetch_actor_input_schema(actor_name)
 
 
 class GetActorCodeInput(BaseModel):
@@ -138,23 +210,31 @@ class GetActorCodeTool(BaseTool):
     @staticmethod
     def _get_code_from_github(repo_urls: list[str], max_tokens: int) -> CodeContext | None:
         """Get code context from GitHub repository."""
+        if not repo_urls:
+            return None
 
+        # No pre-flight GitHub existence probe: UIthub itself answers 404 for
+        # missing repos, so fetching directly saves one round-trip per
+        # candidate on the happy path. First responding URL in order wins.
         for repo_url in repo_urls:
-            if not github_repo_exists(repo_url):
-                continue
-
             parsed_url = urlparse(repo_url)
             repo_path = parsed_url.path.strip('/').replace('.git', '').split('#')[0]
 
-            url = UITHUB_LINK.format(repo_path=repo_path, max_tokens=max_tokens)
-            response = requests.get(url, timeout=REQUESTS_TIMEOUT_SECS)
-            data = response.json()
+            params = urlencode({**UITHUB_PARAMS, 'maxTokens': max_tokens})
+            url = UITHUB_LINK.format(repo_path=repo_path, params=params)
+            response = get_http_session().get(url, timeout=REQUESTS_TIMEOUT_SECS)
+            if not response.ok:
+                logger.info('UIthub returned %s for %s, trying next candidate', response.status_code, repo_url)
+                continue
+            data = json_loads(response.content)
 
             tree = data['tree']
+            # The UIthub payload is trusted and already shaped, so skip
+            # per-file pydantic validation with model_construct.
             filtered_repo_files = [
-                CodeFile(name=name, content=file['content'])
+                CodeFile.model_construct(name=name, content=file['content'])
                 for name, file in data.get('files', {}).items()
-                if not any(substring in name.lower() for substring in IGNORE_FILES) and file['type'] == 'content'
+                if not _is_ignored_file(name) and file['type'] == 'content'
             ]
             return CodeContext(tree=tree, files=filtered_repo_files)
         return None
@@ -165,12 +245,30 @@ class GetActorCodeTool(BaseTool):
 
         tree = generate_file_tree(source_files)
         filtered_source_files = [
-            CodeFile(name=file['name'], content=file['content'])
+            CodeFile.model_construct(name=file['name'], content=file['content'])
             for file in source_files
-            if not any(substring in file['name'].lower() for substring in IGNORE_FILES)
+            if not _is_ignored_file(file['name'])
         ]
         return CodeContext(tree=tree, files=filtered_source_files)
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _fetch_code_context(cls, actor_name: str, max_tokens: int) -> CodeContext | str:
+        """Fetch the code context for an Actor, cached so one run downloads each repo once."""
+        # Try to get the source files
+        if source_files := get_actor_source_files(actor_name):
+            return cls._get_code_from_source(source_files)
+
+        # Fall back to GitHub repository
+        repo_urls = get_actor_github_urls(actor_name)
+        logger.info('Falling back to GitHub URL for Actor %s, repo URLs: %s', actor_name, repo_urls)
+
+        if code_context := cls._get_code_from_github(repo_urls, max_tokens):
+            return code_context
+
+        # If no data is available, return an error message
+        return f'Code for Actor {actor_name} is not available. Skip the tool and grade the code as N/A.'
+
     def _run(self, actor_name: str, max_tokens: int = 120_000) -> CodeContext | str:
         """Execute the tool to retrieve the source code for Apify Actor.
 
@@ -183,30 +281,53 @@ class GetActorCodeTool(BaseTool):
             str: An error message if code context cannot be retrieved at all.
         """
         logger.info('Get code context for Actor %s, max_tokens=%s', actor_name, max_tokens)
-        # Try to get the source files
-        if source_files := get_actor_source_files(actor_name):
-            return self._get_code_from_source(source_files)
+        return self._fetch_code_context(actor_name, max_tokens)
 
-        # Fall back to GitHub repository
-        repo_urls = get_actor_github_urls(actor_name)
-        logger.info('Falling back to GitHub URL for Actor %s, repo URLs: %s', actor_name, repo_urls)
 
-        if code_context := self._get_code_from_github(repo_urls, max_tokens):
-            return code_context
+def _normalize_search(search: str) -> str:
+    """Normalize a keyword search into a cache key so reordered or re-cased duplicates share one entry.
 
-        # If no data is available, return an error message
-        return f'Code for Actor {actor_name} is not available. Skip the tool and grade the code as N/A.'
+    The normalized form is only ever used as a key; the query sent to the API
+    is always the caller's original string, since token order and casing can
+    influence full-text relevance.
+    """
+    return ' '.join(sorted(search.lower().split()))
+
+
+# Validates the raw store list directly against list[ActorStore]; the schema is
+# compiled once at import instead of going through the RootModel wrapper per call.
+_ACTOR_STORE_LIST_ADAPTER = TypeAdapter(list[ActorStore])
+
+# Search results keyed by the normalized query; a plain dict rather than
+# lru_cache so the cache key and the issued query can differ.
+_SEARCH_CACHE: dict[tuple[str, int, int], ActorStoreList] = {}
+
+
+def _search_actors(search: str, limit: int, offset: int) -> ActorStoreList:
+    """Run a store full-text search, cached so overlapping queries from different agents hit the API once."""
+    key = (_normalize_search(search), limit, offset)
+    if (cached := _SEARCH_CACHE.get(key)) is not None:
+        return cached
+
+    apify_client = get_apify_client()
+    search_results = apify_client.store().list(limit=limit, offset=offset, search=search).items
+    items = _ACTOR_STORE_LIST_ADAPTER.validate_python(search_results, strict=False)
+    result = ActorStoreList.model_construct(root=items)
+    _SEARCH_CACHE[key] = result
+    return result
 
 
 class SearchRelatedActorsInput(BaseModel):
     """Input schema for SearchRelatedActors."""
 
-    search: str = Field(
+    searches: list[str] = Field(
         ...,
-        description='A string of keywords to search by. The search is performed across the title,'
+        min_length=1,
+        description='Keyword strings to search by, searched concurrently in one call. Pass several keyword '
+        'sets at once instead of calling the tool repeatedly. The search is performed across the title,'
         'name, description, username, and README of an Actor.',
     )
-    limit: int = Field(10, description='The maximum number of Actors to return', gt=0, le=100)
+    limit: int = Field(10, description='The maximum number of Actors to return per keyword set', gt=0, le=100)
     offset: int = Field(0, description='The number of items to skip from the start of the results.', ge=0)
 
 
@@ -214,23 +335,32 @@ class SearchRelatedActorsTool(BaseTool):
     name: str = 'search_related_actors'
     description: str = (
         'Discover available Actors using a full-text search with specified keywords.'
-        'The tool returns a list of Actors, including details such as name, description, run statistics,'
+        'Accepts several keyword sets in a single call and searches them concurrently.'
+        'The tool returns a merged list of Actors, including details such as name, description, run statistics,'
         'and pricing information, number of stars, and URL.'
-        'Search with only few keywords, otherwise it will return empty results'
+        'Search with only few keywords per set, otherwise it will return empty results'
     )
     args_schema: type[BaseModel] = SearchRelatedActorsInput
 
-    def _run(self, search: str, limit: int = 10, offset: int = 0) -> ActorStoreList | None:
-        """Execute the tool's logic to search related actors by keyword."""
+    def _run(self, searches: list[str], limit: int = 10, offset: int = 0) -> ActorStoreList | None:
+        """Execute the tool's logic to search related actors by several keyword sets concurrently."""
         try:
-            logger.info('Search related Actors with key words: %s', search)
-            apify_client = ApifyClient(token=get_apify_token())
-            search_results = apify_client.store().list(limit=limit, offset=offset, search=search).items
-            logger.info('Found %s Actors related with key words: %s', len(search_results), search)
-            return ActorStoreList.model_validate(search_results, strict=False)
+            logger.info('Search related Actors with key word sets: %s', searches)
+            # Dedupe by normalized form but keep the first-seen original
+            # phrasing as the query actually sent to the API.
+            queries: dict[str, str] = {}
+            for search in searches:
+                queries.setdefault(_normalize_search(search), search)
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                results = list(executor.map(lambda query: _search_actors(query, limit, offset), queries.values()))
+            # Merge the per-query results, deduplicated by Actor identity
+            actors = {(actor.username, actor.name): actor for result in results for actor in result.root}
+            merged = ActorStoreList(root=list(actors.values()))
+            logger.info('Found %s Actors related with key word sets: %s', len(merged.root), searches)
         except Exception as e:
-            logger.exception(f"Failed to search for Actors related to '{search}'")
-            raise ValueError(f"Failed to search for Actors related to '{search}': {e}") from None
+            logger.exception(f"Failed to search for Actors related to '{searches}'")
+            raise ValueError(f"Failed to search for Actors related to '{searches}': {e}") from None
+        return merged
 
 
 class GetActorPricingInfoInput(BaseModel):
@@ -246,20 +376,4 @@ class GetActorPricingInfoTool(BaseTool):
 
     def _run(self, actor_name: str) -> PricingInfo | None:
         logger.info('Get pricing information for actor %s', actor_name)
-        apify_client = ApifyClient(token=get_apify_token())
-        actor = apify_client.actor(actor_name).get()
-        if not actor:
-            raise ValueError(f'Actor {actor_name} not found.')
-
-        pricing_info = actor.get('pricingInfos')
-        if not pricing_info:
-            return PricingInfo(pricing_model='PAY_PER_PLATFORM_USAGE')
-
-        current_pricing = None
-        now = datetime.datetime.now(datetime.UTC)
-        for pricing_entry in pricing_info:
-            if pricing_entry.get('startedAt') > now:
-                break
-            current_pricing = pricing_entry
-
-        return PricingInfo.model_validate(current_pricing)
+        return _fetch_actor_pricing_info(actor_name)
@@ -1,21 +1,55 @@
+from __future__ import annotations
+
 import logging
 import os
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import requests
-from apify_client import ApifyClient
+from requests.adapters import HTTPAdapter, Retry
+
+try:  # orjson parses bytes directly and is several times faster than stdlib json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from src.const import REQUESTS_TIMEOUT_SECS
 
-APIFY_API_GET_DEFAULT_BUILD = 'https://api.apify.com/v2/acts/{actor_id}/builds/default'
+if TYPE_CHECKING:
+    from apify_client import ApifyClient
+
+APIFY_API_BASE_URL = 'https://api.apify.com/v2/acts/'
 
 logger = logging.getLogger('apify')
 
+# One pooled session shared by all outbound HTTP calls so repeated requests to
+# the Apify API, GitHub and UIthub reuse TCP+TLS connections instead of paying
+# a handshake per call. Transient gateway errors are retried with backoff
+# rather than surfacing as a missing repo or build.
+_http_session = requests.Session()
+_http_session.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    ),
+)
+
 
+def get_http_session() -> requests.Session:
+    """Return the shared pooled HTTP session."""
+    return _http_session
+
+
+@lru_cache(maxsize=1)
 def get_apify_token() -> str:
     """
     Retrieve the Apify API token from environment variables.
 
+    Cached after the first call; the token does not change within a run.
+
     Returns:
         str: The Apify API token.
 
@@ -27,10 +61,26 @@ def get_apify_token() -> str:
     return token
 
 
+@lru_cache(maxsize=1)
+def get_apify_client() -> ApifyClient:
+    """Return the shared ApifyClient so all calls reuse one authenticated HTTP session.
+
+    The import is deferred to first use so merely importing this module does
+    not pull in the apify_client stack.
+    """
+    from apify_client import ApifyClient
+
+    return ApifyClient(token=get_apify_token())
+
+
+@lru_cache(maxsize=512)
 def get_actor_id(actor_name: str) -> str:
     """
     Retrieve the Actor ID for a given Actor name.
 
+    Memoized: Actor IDs are immutable, and several helpers resolve the same
+    name before their own API call, so repeat lookups cost nothing.
+
     Args:
         actor_name (str): The name of the Actor.
 
@@ -41,7 +91,7 @@ def get_actor_id(actor_name: str) -> str:
         ValueError: If the Actor is not found or the Actor ID cannot be retrieved.
     """
     logger.debug('Get Actor ID for Actor %s', actor_name)
-    apify_client = ApifyClient(token=get_apify_token())
+    apify_client = get_apify_client()
     if not (actor := apify_client.actor(actor_name).get()):
         raise ValueError(f'Actor {actor_name} not found.')
 
@@ -64,24 +114,14 @@ def generate_file_tree(files: list[dict]) -> dict:
     tree: dict = {}
 
     for file_info in files:
-        # Split the path into components
         path_parts = file_info['name'].split('/')
 
-        # Start with the root of our tree
+        # Walk the directory parts with setdefault (one dict probe per level),
+        # then mark the final part as a file.
         current = tree
-
-        # Process each part of the path
-        for i, part in enumerate(path_parts):
-            # If it's the last part (the file), set it to None
-            if i == len(path_parts) - 1:
-                current[part] = None
-            # Otherwise, it's a directory
-            else:
-                # If the directory doesn't exist yet, create it
-                if part not in current:
-                    current[part] = {}
-                # Move to the next level
-                current = current[part]
+        for part in path_parts[:-1]:
+            current = current.setdefault(part, {})
+        current[path_parts[-1]] = None
 
     return tree
 
@@ -100,37 +140,36 @@ def get_actor_github_urls(actor_name: str) -> list[str]:
         ValueError: If the Actor is not found or the Actor ID cannot be retrieved.
     """
     logger.debug('Get GitHub URLs for Actor %s', actor_name)
-    apify_client = ApifyClient(token=get_apify_token())
+    apify_client = get_apify_client()
     actor_id = get_actor_id(actor_name)
-    github_urls = []
-    build = get_actor_latest_build(actor_id)
-    if github_repo_url := build.get('actVersion', {}).get('gitRepoUrl'):
-        github_urls.append(github_repo_url)
-
-    versions = apify_client.actor(actor_id).versions().list().items
-    github_urls.extend(version.get('gitRepoUrl') for version in versions if version.get('gitRepoUrl'))
 
-    return github_urls
-
-
-def github_repo_exists(repository_url: str) -> bool:
-    """
-    Check if a GitHub repository exists.
+    # The latest build and the version listing are independent round-trips,
+    # so fetch them concurrently once the Actor ID is known.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        build_future = executor.submit(get_actor_latest_build, actor_id)
+        versions_future = executor.submit(lambda: apify_client.actor(actor_id).versions().list().items)
+        build = build_future.result()
+        versions = versions_future.result()
+
+    # The build's repo URL usually reappears in the version list; dedupe while
+    # keeping insertion order so downstream probes pay one fetch per repo.
+    github_urls: dict[str, None] = {}
+    if github_repo_url := build.get('actVersion', {}).get('gitRepoUrl'):
+        github_urls[github_repo_url] = None
 
-    Args:
-        repository_url (str): The URL of the GitHub repository.
+    github_urls.update((url, None) for version in versions if (url := version.get('gitRepoUrl')))
 
-    Returns:
-        bool: True if the repository exists, False otherwise.
-    """
-    verify_response = requests.get(repository_url, timeout=REQUESTS_TIMEOUT_SECS)
-    return bool(verify_response.status_code == requests.codes.ok)
+    return list(github_urls)
 
 
+@lru_cache(maxsize=256)
 def get_actor_source_files(actor_name: str) -> list[dict]:
     """
     Retrieve the source files for the latest version of an Actor from the default build tag.
 
+    Memoized per process like the build lookup, so repeat calls within one
+    grading run skip the API round-trip.
+
     Args:
         actor_name (str): The name of the Actor.
 
@@ -138,7 +177,7 @@ def get_actor_source_files(actor_name: str) -> list[dict]:
         list[dict]: A list of dictionaries representing the source files of the Actor.
     """
     logger.debug('Get source files for Actor %s', actor_name)
-    apify_client = ApifyClient(token=get_apify_token())
+    apify_client = get_apify_client()
     actor_id = get_actor_id(actor_name)
     versions = apify_client.actor(actor_id).versions().list().items
     if latest_version := next((x for x in versions if x.get('buildTag') == 'latest'), None):
@@ -147,9 +186,13 @@ def get_actor_source_files(actor_name: str) -> list[dict]:
     return []
 
 
+@lru_cache(maxsize=256)
 def get_actor_latest_build(actor_name: str) -> dict[str, Any]:
     """Get the latest build of an Actor from the default build tag.
 
+    Memoized per process: the README, input-schema and GitHub-URL helpers all
+    need the same build, so repeat lookups for one Actor cost one API call.
+
     Args:
         actor_name (str): Actor name from Apify store to run.
 
@@ -161,12 +204,12 @@ def get_actor_latest_build(actor_name: str) -> dict[str, Any]:
         TypeError: If the build is not a dictionary.
     """
     actor_obj_id = get_actor_id(actor_name)
-    url = APIFY_API_GET_DEFAULT_BUILD.format(actor_id=actor_obj_id)
+    url = f'{APIFY_API_BASE_URL}{actor_obj_id}/builds/default'
 
     logger.debug('Get latest build for Actor URL: %s', url)
-    response = requests.request('GET', url, timeout=REQUESTS_TIMEOUT_SECS)
+    response = _http_session.get(url, timeout=REQUESTS_TIMEOUT_SECS)
 
-    build = response.json()
+    build = json_loads(response.content)
     if not isinstance(build, dict):
         msg = f'Failed to get the latest build of the Actor {actor_name}.'
         raise TypeError(msg)